@@ -5,7 +5,8 @@ sys.path.append('src')
 
 from cfbmeta.data_fetcher import load_scoreboard, ScoreboardLoadError
 from cfbmeta.models import parse_games
-from cfbmeta.analysis import interest_score, select_top_games
+from cfbmeta.analysis import rank_games
+from cfbmeta.cards import build_game_cards, filter_cards, page_count, paginate
 
 # Page configuration
 st.set_page_config(
@@ -60,6 +61,25 @@ st.markdown("""
 st.title("🏈 College Football Game Tracker")
 st.markdown("### Find the best games to watch right now!")
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_snapshot(date_str: str) -> dict:
+    """Fetches, ranks and formats a scoreboard once per snapshot.
+
+    Reruns triggered by the filters, slider or pagination reuse the cached
+    cards, so each game is scored and formatted only when the scoreboard is
+    reloaded.
+    """
+    all_games = list(parse_games(load_scoreboard(date=date_str)))
+    cards = build_game_cards(rank_games(all_games))
+    return {
+        "total": len(cards),
+        "live": sum(1 for c in cards if c.is_live),
+        "ranked": sum(1 for c in cards if c.is_ranked),
+        "final": sum(1 for c in cards if c.is_final),
+        "cards": cards,
+    }
+
+
 # Sidebar controls
 with st.sidebar:
     st.header("⚙️ Settings")
@@ -74,6 +94,7 @@ with st.sidebar:
     
     # Refresh button
     if st.button("🔄 Refresh Games", type="primary"):
+        load_snapshot.clear()
         st.rerun()
     
     st.divider()
@@ -83,6 +104,7 @@ with st.sidebar:
     show_only_live = st.checkbox("Show Only Live Games", value=False)
     show_only_ranked = st.checkbox("Show Only Ranked Teams", value=False)
     max_games = st.slider("Max Games to Display", 5, 50, 20)
+    page_size = st.selectbox("Games per Page", [5, 10, 20], index=1)
     
     st.divider()
     st.markdown("### About")
@@ -96,123 +118,73 @@ with st.sidebar:
     """)
 
 # Main content
+def render_card(card) -> None:
+    with st.container():
+        # Game card layout
+        col1, col2, col3 = st.columns([3, 2, 1])
+
+        with col1:
+            st.markdown(f"{card.matchup}\n\n{card.headline}")
+
+        with col2:
+            st.markdown(card.status_markdown)
+
+        with col3:
+            # Interest score
+            interest = (
+                f"{card.interest_emoji} **Interest Score**\n\n"
+                f"<span class='{card.interest_class}'>{card.interest:.1f}</span>"
+            )
+            if card.close_game:
+                interest += "\n\n🔥 **CLOSE GAME!**"
+            st.markdown(interest, unsafe_allow_html=True)
+
+        # Add notes if available
+        if card.notes:
+            with st.expander("Game Notes"):
+                st.markdown(card.notes_markdown)
+
+        st.divider()
+
+
 try:
     # Load scoreboard data
     with st.spinner("Loading games..."):
-        scoreboard_data = load_scoreboard(date=date_str)
-        all_games = list(parse_games(scoreboard_data))
-    
-    if not all_games:
+        snapshot = load_snapshot(date_str)
+
+    if not snapshot["total"]:
         st.warning("No games found for this date.")
     else:
-        # Apply filters
-        filtered_games = all_games
-        
-        if show_only_live:
-            filtered_games = [g for g in filtered_games if g.is_live]
-        
-        if show_only_ranked:
-            filtered_games = [g for g in filtered_games if g.home.rank or g.away.rank]
-        
-        # Get top games by interest score
-        top_games = select_top_games(filtered_games, limit=max_games)
-        
         # Display summary stats
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Games", len(all_games))
+            st.metric("Total Games", snapshot["total"])
         with col2:
-            live_count = sum(1 for g in all_games if g.is_live)
-            st.metric("Live Now", live_count)
+            st.metric("Live Now", snapshot["live"])
         with col3:
-            ranked_count = sum(1 for g in all_games if g.home.rank or g.away.rank)
-            st.metric("Ranked Games", ranked_count)
+            st.metric("Ranked Games", snapshot["ranked"])
         with col4:
-            final_count = sum(1 for g in all_games if g.is_final)
-            st.metric("Final", final_count)
-        
+            st.metric("Final", snapshot["final"])
+
         st.divider()
-        
+
         # Display games
-        if not top_games:
+        cards = filter_cards(snapshot["cards"], show_only_live, show_only_ranked)
+        shown = min(max_games, len(cards))
+        if not shown:
             st.info("No games match your filter criteria.")
         else:
-            st.subheader(f"Top {len(top_games)} Games to Watch")
-            
-            # Create columns for game cards
-            for idx, game in enumerate(top_games):
-                with st.container():
-                    # Calculate interest score and get color
-                    score = interest_score(game)
-                    if score > 50:
-                        interest_class = "interest-high"
-                        interest_emoji = "🔥"
-                    elif score > 30:
-                        interest_class = "interest-medium"
-                        interest_emoji = "⭐"
-                    else:
-                        interest_class = "interest-low"
-                        interest_emoji = "📊"
-                    
-                    # Game card layout
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    
-                    with col1:
-                        # Teams and scores
-                        team_display = f"**{game.away.name}**"
-                        if game.away.rank:
-                            team_display = f"#{game.away.rank} {team_display}"
-                        team_display += f" ({game.away.record or 'N/A'})"
-                        
-                        home_display = f"**{game.home.name}**"
-                        if game.home.rank:
-                            home_display = f"#{game.home.rank} {home_display}"
-                        home_display += f" ({game.home.record or 'N/A'})"
-                        
-                        st.markdown(f"🏈 {team_display} @ {home_display}")
-                        
-                        # Score
-                        if game.is_live or game.is_final:
-                            score_text = f"### {game.away.score} - {game.home.score}"
-                            if game.is_live:
-                                score_text += f" 🔴 LIVE"
-                            st.markdown(score_text)
-                        else:
-                            st.markdown(f"*Kickoff: {game.start_time.strftime('%I:%M %p ET')}*")
-                    
-                    with col2:
-                        # Game status and info
-                        if game.is_live:
-                            st.markdown(f"**Quarter {game.period}** - {game.clock}")
-                        elif game.is_final:
-                            st.markdown("**FINAL**")
-                            if game.winner:
-                                st.markdown(f"Winner: {game.winner.name}")
-                        else:
-                            st.markdown(f"**Scheduled**")
-                        
-                        if game.broadcasts:
-                            st.markdown(f"📺 {', '.join(game.broadcasts)}")
-                        
-                        if game.venue:
-                            st.markdown(f"📍 {game.venue}")
-                    
-                    with col3:
-                        # Interest score
-                        st.markdown(f"{interest_emoji} **Interest Score**")
-                        st.markdown(f"<span class='{interest_class}'>{score:.1f}</span>", 
-                                  unsafe_allow_html=True)
-                        
-                        if game.is_live and game.period >= 3 and game.score_margin <= 8:
-                            st.markdown("🔥 **CLOSE GAME!**")
-                    
-                    # Add notes if available
-                    if game.notes:
-                        with st.expander("Game Notes"):
-                            for note in game.notes:
-                                st.write(f"• {note}")
-                    
-                    st.divider()
+            st.subheader(f"Top {shown} Games to Watch")
+
+            # Only emit the cards on the current page
+            pages = page_count(shown, page_size)
+            page = 1
+            if pages > 1:
+                page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+                st.caption(f"Page {page} of {pages}")
+
+            for card in paginate(cards, page, page_size, limit=max_games):
+                render_card(card)
 
 except ScoreboardLoadError as e:
     st.error(f"Failed to load games: {e}")
@@ -223,4 +195,4 @@ except Exception as e:
 
 # Footer
 st.markdown("---")
-st.caption("Data from ESPN API • Updates every refresh • Interest score algorithm prioritizes close games and ranked matchups")
+st.caption("Data from ESPN API • Cached for one minute or until Refresh Games is pressed • Interest score algorithm prioritizes close games and ranked matchups")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Sequence, Tuple
 
 from .models import Game
 
@@ -91,8 +91,19 @@ def summarize_games(games: Sequence[Game], include_notes: bool = False) -> List[
     ]
 
 
-def select_top_games(games: Iterable[Game], limit: int | None = None) -> List[Game]:
-    ranked = sorted(games, key=interest_score, reverse=True)
+def rank_games(
+    games: Iterable[Game], limit: int | None = None, now: datetime | None = None
+) -> List[Tuple[Game, float]]:
+    """Scores each game once and returns ``(game, score)`` pairs, best first."""
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    scored = [(game, interest_score(game, now=now)) for game in games]
+    scored.sort(key=lambda pair: pair[1], reverse=True)
     if limit is None:
-        return ranked
-    return ranked[:limit]
+        return scored
+    return scored[:limit]
+
+
+def select_top_games(games: Iterable[Game], limit: int | None = None) -> List[Game]:
+    return [game for game, _ in rank_games(games, limit=limit)]
@@ -0,0 +1,126 @@
+"""View-models for rendering game cards in the web interface."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .models import Game, TeamScore
+
+
+@dataclass(frozen=True)
+class GameCard:
+    """Pre-formatted display data for a single game card."""
+
+    game_id: str
+    matchup: str
+    headline: str
+    status_lines: Tuple[str, ...]
+    interest: float
+    interest_class: str
+    interest_emoji: str
+    close_game: bool
+    is_live: bool
+    is_ranked: bool
+    is_final: bool
+    notes: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def status_markdown(self) -> str:
+        return "  \n".join(self.status_lines)
+
+    @property
+    def notes_markdown(self) -> str:
+        # Markdown collapses a bare newline into a space; use hard line breaks.
+        return "  \n".join(f"• {note}" for note in self.notes)
+
+
+def build_game_card(game: Game, score: float) -> GameCard:
+    """Formats a game and its already-computed interest score for display."""
+
+    if score > 50:
+        interest_class, interest_emoji = "interest-high", "🔥"
+    elif score > 30:
+        interest_class, interest_emoji = "interest-medium", "⭐"
+    else:
+        interest_class, interest_emoji = "interest-low", "📊"
+
+    if game.is_live or game.is_final:
+        headline = f"### {game.away.score} - {game.home.score}"
+        if game.is_live:
+            headline += " 🔴 LIVE"
+    else:
+        headline = f"*Kickoff: {game.start_time.strftime('%I:%M %p ET')}*"
+
+    status_lines: List[str] = []
+    if game.is_live:
+        status_lines.append(f"**Quarter {game.period}** - {game.clock}")
+    elif game.is_final:
+        status_lines.append("**FINAL**")
+        if game.winner:
+            status_lines.append(f"Winner: {game.winner.name}")
+    else:
+        status_lines.append("**Scheduled**")
+    if game.broadcasts:
+        status_lines.append(f"📺 {', '.join(game.broadcasts)}")
+    if game.venue:
+        status_lines.append(f"📍 {game.venue}")
+
+    return GameCard(
+        game_id=game.id,
+        matchup=f"🏈 {_team_label(game.away)} @ {_team_label(game.home)}",
+        headline=headline,
+        status_lines=tuple(status_lines),
+        interest=score,
+        interest_class=interest_class,
+        interest_emoji=interest_emoji,
+        close_game=game.is_live and game.period >= 3 and game.score_margin <= 8,
+        is_live=game.is_live,
+        is_ranked=bool(game.home.rank or game.away.rank),
+        is_final=game.is_final,
+        notes=tuple(game.notes),
+    )
+
+
+def build_game_cards(scored_games: Iterable[Tuple[Game, float]]) -> List[GameCard]:
+    """Builds cards from ``(game, score)`` pairs such as those from ``rank_games``."""
+
+    return [build_game_card(game, score) for game, score in scored_games]
+
+
+def filter_cards(
+    cards: Sequence[GameCard], only_live: bool = False, only_ranked: bool = False
+) -> Sequence[GameCard]:
+    """Applies the display filters without re-ranking or re-formatting."""
+
+    if not (only_live or only_ranked):
+        return cards
+    return [
+        card
+        for card in cards
+        if (card.is_live or not only_live) and (card.is_ranked or not only_ranked)
+    ]
+
+
+def page_count(total: int, page_size: int) -> int:
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    return max(1, -(-total // page_size))
+
+
+def paginate(
+    cards: Sequence[GameCard], page: int, page_size: int, limit: Optional[int] = None
+) -> Sequence[GameCard]:
+    """Returns the cards on a 1-indexed ``page``, considering only the first ``limit``."""
+
+    total = len(cards) if limit is None else min(limit, len(cards))
+    page = min(max(page, 1), page_count(total, page_size))
+    start = (page - 1) * page_size
+    return cards[start : min(start + page_size, total)]
+
+
+def _team_label(team: TeamScore) -> str:
+    label = f"**{team.name}**"
+    if team.rank:
+        label = f"#{team.rank} {label}"
+    return f"{label} ({team.record or 'N/A'})"
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import pytest
+
+from cfbmeta.models import Game, parse_games
+from cfbmeta.data_fetcher import load_scoreboard
+
+
+@pytest.fixture(scope="module")
+def sample_games() -> list[Game]:
+    scoreboard = load_scoreboard(scoreboard_path="tests/data/espn_scoreboard_sample.json")
+    return list(parse_games(scoreboard))
@@ -3,15 +3,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import pytest
 
-from cfbmeta.analysis import build_game_summary, interest_score, select_top_games
-from cfbmeta.models import Game, parse_games
-from cfbmeta.data_fetcher import load_scoreboard
-
-
-@pytest.fixture(scope="module")
-def sample_games() -> list[Game]:
-    scoreboard = load_scoreboard(scoreboard_path="tests/data/espn_scoreboard_sample.json")
-    return list(parse_games(scoreboard))
+from cfbmeta.analysis import build_game_summary, interest_score, rank_games, select_top_games
+from cfbmeta.models import Game
 
 
 def test_parse_games(sample_games: list[Game]) -> None:
@@ -56,3 +49,11 @@ def test_build_game_summary_includes_tv(sample_games: list[Game]) -> None:
     summary = build_game_summary(game, include_notes=True)
     assert "TV: ESPN" in summary
     assert "Ducks convert" in summary
+
+
+def test_rank_games_reuses_scores(sample_games: list[Game]) -> None:
+    now = datetime(2023, 10, 21, 23, 45, tzinfo=timezone.utc)
+    ranked = rank_games(sample_games, limit=3, now=now)
+    assert len(ranked) == 3
+    assert [score for _, score in ranked] == [interest_score(g, now=now) for g, _ in ranked]
+    assert [score for _, score in ranked] == sorted((s for _, s in ranked), reverse=True)
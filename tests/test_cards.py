@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from cfbmeta.analysis import rank_games
+from cfbmeta.cards import build_game_cards, filter_cards, page_count, paginate
+from cfbmeta.models import Game
+
+
+def test_cards_keep_ranking_scores(sample_games: list[Game]) -> None:
+    now = datetime(2023, 10, 21, 23, 45, tzinfo=timezone.utc)
+    ranked = rank_games(sample_games, now=now)
+    cards = build_game_cards(ranked)
+    assert [c.game_id for c in cards] == [g.id for g, _ in ranked]
+    assert [c.interest for c in cards] == [s for _, s in ranked]
+
+
+def test_close_late_game_card(sample_games: list[Game]) -> None:
+    game = next(g for g in sample_games if g.id == "401514123")
+    card = build_game_cards([(game, 75.0)])[0]
+    assert card.interest_class == "interest-high"
+    assert card.close_game
+    assert "LIVE" in card.headline
+    assert "Washington State Cougars" in card.matchup
+
+
+def test_final_game_card_lists_winner(sample_games: list[Game]) -> None:
+    game = next(g for g in sample_games if g.id == "401514400")
+    card = build_game_cards([(game, 22.5)])[0]
+    assert card.interest_class == "interest-low"
+    assert card.status_lines[0] == "**FINAL**"
+    assert card.status_lines[1] == f"Winner: {game.winner.name}"
+
+
+def test_paginate_respects_limit(sample_games: list[Game]) -> None:
+    cards = build_game_cards(rank_games(sample_games))
+    assert page_count(3, 2) == 2
+    assert page_count(0, 2) == 1
+    assert list(paginate(cards, 1, 2, limit=3)) == cards[:2]
+    assert list(paginate(cards, 2, 2, limit=3)) == cards[2:3]
+    assert list(paginate(cards, 9, 2, limit=3)) == cards[2:3]
+    assert list(paginate(cards, 1, 10)) == cards
+
+
+def test_notes_render_on_separate_lines(sample_games: list[Game]) -> None:
+    game = replace(sample_games[0], notes=["TEX -7.5", "Recap"])
+    card = build_game_cards([(game, 10.0)])[0]
+    assert card.notes_markdown.split("  \n") == ["• TEX -7.5", "• Recap"]
+
+
+def test_filter_cards_uses_card_flags(sample_games: list[Game]) -> None:
+    cards = build_game_cards(rank_games(sample_games))
+    assert filter_cards(cards) is cards
+    live = filter_cards(cards, only_live=True)
+    assert live and all(c.is_live for c in live)
+    ranked = filter_cards(cards, only_ranked=True)
+    assert all(c.is_ranked for c in ranked)
+    assert len(ranked) == sum(1 for g in sample_games if g.home.rank or g.away.rank)